@@ -0,0 +1,205 @@
+"""Benchmark runner for the daily solutions
+
+Imports each day_NN/day_NN.py module, runs the selected parts and reports
+wall time, CPU time and peak RSS per part as JSON. Run it from the
+repository root since the solutions open their inputs with relative paths:
+
+    python benchmark.py 1 5 7 --parts 1 2 --repeat 5 --warmup 1
+"""
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import multiprocessing
+import platform
+import queue
+import resource
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPOSITORY_ROOT = Path(__file__).resolve().parent
+
+
+def find_days():
+    return sorted(
+        int(path.name.split("_")[1])
+        for path in REPOSITORY_ROOT.glob("day_[0-9][0-9]")
+        if (path / f"{path.name}.py").is_file()
+    )
+
+
+def import_day_module(day: int):
+    name = f"day_{day:02d}"
+    return importlib.import_module(f"{name}.{name}")
+
+
+def time_call(function):
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    function()
+    cpu_time = time.process_time() - cpu_start
+    wall_time = time.perf_counter() - wall_start
+    return wall_time, cpu_time
+
+
+def measure_part(day: int, part: int, repeat: int, warmup: int,
+                 show_output: bool, use_parse_cache: bool, results):
+    """Runs in a fresh interpreter so the peak RSS belongs to this part
+    alone. The measurement is put on the _results_ queue.
+    """
+    sys.path.insert(0, str(REPOSITORY_ROOT))
+    module = import_day_module(day)
+    if use_parse_cache:
+        from parse_cache import ParseCache, install_parse_cache
+        install_parse_cache(module, ParseCache())
+    function = getattr(module, f"part_{part}")
+    output = contextlib.nullcontext() if show_output \
+        else contextlib.redirect_stdout(io.StringIO())
+
+    wall_times = []
+    cpu_times = []
+    with output:
+        for _ in range(warmup):
+            function()
+        for _ in range(repeat):
+            wall_time, cpu_time = time_call(function)
+            wall_times.append(wall_time)
+            cpu_times.append(cpu_time)
+
+    # ru_maxrss is reported in kilobytes on Linux and bytes on macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak_rss //= 1024
+    results.put({
+        "wall_time": wall_times,
+        "cpu_time": cpu_times,
+        "peak_rss_kb": peak_rss,
+    })
+
+
+def summarize(times: list[float]):
+    return {
+        "min": min(times),
+        "mean": statistics.mean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+    }
+
+
+def receive_measurement(process, results, timeout: float = None):
+    """Waits for the measurement of _process_ on the _results_ queue. The
+    process can not exit before its measurement has been read from the
+    queue, so the measurement is read before the process is joined.
+
+    Returns:
+        dict: The measurement, or None if the process exited without one
+              or did not send it within _timeout_ seconds.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while deadline is None or time.monotonic() < deadline:
+        try:
+            return results.get(timeout=0.1)
+        except queue.Empty:
+            if not process.is_alive():
+                break
+
+    # A process that exited after a successful put has flushed it already
+    try:
+        return results.get(timeout=0.1)
+    except queue.Empty:
+        return None
+
+
+def benchmark_part(day: int, part: int, repeat: int = 1, warmup: int = 0,
+                   timeout: float = None, show_output: bool = False,
+                   use_parse_cache: bool = False):
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(
+        target=measure_part,
+        args=(day, part, repeat, warmup, show_output, use_parse_cache,
+              results)
+    )
+    process.start()
+    measurement = receive_measurement(process, results, timeout)
+    record = {"day": day, "part": part}
+    if measurement is None and process.is_alive():
+        process.terminate()
+        process.join()
+        record["error"] = f"timed out after {timeout} seconds"
+    elif measurement is None:
+        process.join()
+        record["error"] = f"exited with code {process.exitcode}"
+    else:
+        process.join()
+        record.update(measurement)
+        record["wall_time_summary"] = summarize(measurement["wall_time"])
+        record["cpu_time_summary"] = summarize(measurement["cpu_time"])
+
+    return record
+
+
+def run_benchmarks(days: list[int], parts: list[int], repeat: int = 1,
+                   warmup: int = 0, timeout: float = None,
+                   show_output: bool = False, use_parse_cache: bool = False):
+    records = []
+    for day in days:
+        for part in parts:
+            record = benchmark_part(day, part, repeat, warmup, timeout,
+                                    show_output, use_parse_cache)
+            print(f"day {day:02d} part {part}: "
+                  + (record.get("error")
+                     or f"{record['wall_time_summary']['min']:.4f} s"),
+                  file=sys.stderr)
+            records.append(record)
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "warmup": warmup,
+        "parse_cache": use_parse_cache,
+        "results": records,
+    }
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("days", nargs="*", type=int,
+                        help="Days to benchmark, all days if omitted.")
+    parser.add_argument("--parts", nargs="+", type=int, default=[1, 2],
+                        choices=[1, 2])
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="Timed runs per part.")
+    parser.add_argument("--warmup", type=int, default=0,
+                        help="Untimed runs per part before timing.")
+    parser.add_argument("--timeout", type=float, default=None,
+                        help="Seconds before a part is abandoned.")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="Write the JSON report here instead of stdout.")
+    parser.add_argument("--show-output", action="store_true",
+                        help="Do not silence what the parts print.")
+    parser.add_argument("--parse-cache", action="store_true",
+                        help="Serve parsed inputs from the parse cache.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    arguments = parse_arguments(argv)
+    if arguments.repeat < 1:
+        raise ValueError("At least one timed run is needed.")
+    report = run_benchmarks(arguments.days or find_days(), arguments.parts,
+                            arguments.repeat, arguments.warmup,
+                            arguments.timeout, arguments.show_output,
+                            arguments.parse_cache)
+    report_json = json.dumps(report, indent=4)
+    if arguments.output is None:
+        print(report_json)
+    else:
+        arguments.output.write_text(report_json + "\n")
+
+
+if __name__ == "__main__":
+    main()
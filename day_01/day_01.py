@@ -1,3 +1,7 @@
+import heapq
+from typing import Iterable
+
+
 def get_inventories_from_file(filename):
     with open(filename) as f:
         inventories = []
@@ -8,11 +12,111 @@ def get_inventories_from_file(filename):
                 inventory = []
             else:
                 inventory.append(int(line.strip()))
+        if inventory:
+            inventories.append(inventory)
 
     return inventories
 
 
+def stream_inventory_totals(lines: Iterable[str]):
+    """Sums each inventory as its lines arrive, so only the running total of
+    the current inventory is kept in memory.
+
+    Args:
+        lines (Iterable[str]): Calorie lines, e.g. an open file.
+
+    Yields:
+        int: The total calories of each inventory, in order. Like
+             get_inventories_from_file, every blank line ends an inventory,
+             so repeated blank lines yield empty inventories as 0.
+    """
+    total = None
+    for line in lines:
+        if line.strip():
+            total = int(line) if total is None else total + int(line)
+        else:
+            yield total or 0
+            total = None
+    if total is not None:
+        yield total
+
+
+def get_n_highest_calory_totals_streaming(lines: Iterable[str], n: int):
+    """Same result as get_n_highest_calory_inventories, but keeps a min-heap
+    of the _n_ highest totals instead of every inventory.
+    """
+    if n <= 0:
+        return []
+    highest = []
+    for total in stream_inventory_totals(lines):
+        if len(highest) < n:
+            heapq.heappush(highest, total)
+        elif total > highest[0]:
+            heapq.heapreplace(highest, total)
+    return sorted(highest)
+
+
+def get_inventory_totals_from_file_numpy(filename):
+    """Parses the whole file with vectorized NumPy operations instead of a
+    Python loop per line. The numbers are assembled one digit place at a
+    time for all lines at once, counting back from each newline, and the
+    inventories are summed with a single reduceat.
+
+    Args:
+        filename (str): Calorie list with inventories separated by blank
+                        lines. The lines may only contain digits.
+
+    Returns:
+        numpy.ndarray: The total calories of each inventory, with the same
+                       inventories as get_inventories_from_file. It can be
+                       passed to get_highest_calory_inventory and
+                       get_n_highest_calory_inventories in place of the
+                       inventory lists.
+    """
+    import numpy as np
+
+    newline = ord("\n")
+    data = np.fromfile(filename, dtype=np.uint8)
+    if (data == ord("\r")).any():
+        data = data[data != ord("\r")]
+    if len(data) == 0:
+        return np.zeros(0, dtype=np.int64)
+    is_digit = (data >= ord("0")) & (data <= ord("9"))
+    if not (is_digit | (data == newline)).all():
+        raise ValueError("The calorie list contains lines that are not "
+                         "numbers.")
+    if data[-1] != newline:
+        data = np.append(data, np.uint8(newline))
+
+    newlines = np.flatnonzero(data == newline)
+    line_lengths = np.diff(newlines, prepend=-1) - 1
+    numbers = np.zeros(len(newlines), dtype=np.int64)
+    for place in range(int(line_lengths.max())):
+        digits = data[newlines - 1 - place].astype(np.int64) - ord("0")
+        digits[line_lengths <= place] = 0
+        numbers += digits * 10**place
+
+    # Like get_inventories_from_file, every blank line ends an inventory,
+    # even an empty one, while the lines after the last blank line only
+    # form an inventory if there are any. Blank lines parse as 0, so each
+    # inventory can be summed together with the blank line ending it.
+    inventory_starts = np.concatenate(
+        ([0], np.flatnonzero(line_lengths == 0) + 1)
+    )
+    if inventory_starts[-1] == len(numbers):
+        inventory_starts = inventory_starts[:-1]
+    return np.add.reduceat(numbers, inventory_starts)
+
+
+def is_totals_array(inventories):
+    return getattr(inventories, "ndim", None) == 1
+
+
 def get_highest_calory_inventory(inventories):
+    if is_totals_array(inventories):
+        index = int(inventories.argmax())
+        return index, int(inventories[index])
+
     index, inventory = max(
         enumerate(inventories),
         key=lambda enumeration: sum(enumeration[1])
@@ -21,6 +125,13 @@ def get_highest_calory_inventory(inventories):
 
 
 def get_n_highest_calory_inventories(inventories, n):
+    if n <= 0:
+        return []
+    if is_totals_array(inventories):
+        if n < len(inventories):
+            inventories = inventories[inventories.argpartition(-n)[-n:]]
+        return sorted(inventories.tolist())[-n:]
+
     inventories_sorted = sorted(map(sum, inventories))
     return inventories_sorted[-n:]
 
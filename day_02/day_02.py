@@ -1,7 +1,13 @@
 """2022/12/02 - Rock, Paper, Scissors
 """
 
+from collections import Counter
 from enum import IntEnum
+from itertools import permutations, product
+from multiprocessing import Pool, cpu_count
+import os
+import re
+import time
 
 
 class Choice(IntEnum):
@@ -121,6 +127,287 @@ def evaluate_strategy_guide_p2(filename: str):
     return total_score
 
 
+# The nine possible lines of a strategy guide. The index of a line type is
+# 3 * opponent + player, counting A/X as 0.
+LINE_TYPES = [f"{opponent} {player}"
+              for opponent in "ABC" for player in "XYZ"]
+
+
+def create_score_table_p1(translations: dict = STRATEGY_TRANSLATIONS_P1):
+    score_table = []
+    for line_type in LINE_TYPES:
+        opponent_choice, player_choice = map(translations.get,
+                                             line_type.split())
+        player_outcome = determine_outcome(player_choice, opponent_choice)
+        score_table.append(calculate_score(player_choice, player_outcome))
+
+    return score_table
+
+
+def create_score_table_p2(translations: dict = STRATEGY_TRANSLATIONS_P2):
+    score_table = []
+    for line_type in LINE_TYPES:
+        opponent_choice, desired_outcome = map(translations.get,
+                                               line_type.split())
+        player_choice = determine_choice_needed_for_outcome(
+            opponent_choice, desired_outcome
+        )
+        score_table.append(calculate_score(player_choice, desired_outcome))
+
+    return score_table
+
+
+SCORE_TABLE_P1 = create_score_table_p1()
+SCORE_TABLE_P2 = create_score_table_p2()
+
+
+def count_line_types(filename: str) -> list[int]:
+    """Counts how many times each of the nine line types occurs in the
+    strategy guide, in a single pass over the file.
+
+    Returns:
+        list[int]: Occurrences of each line type, indexed like LINE_TYPES.
+    """
+    line_type_indices = {line_type: i
+                         for i, line_type in enumerate(LINE_TYPES)}
+    histogram = [0] * len(LINE_TYPES)
+    with open(filename) as f:
+        for line, count in Counter(f).items():
+            line = line.strip()
+            if line:
+                histogram[line_type_indices[line]] += count
+
+    return histogram
+
+
+def count_line_types_numpy(filename: str) -> list[int]:
+    """Same as count_line_types, but reads the raw bytes with NumPy. Every
+    line has exactly one space, the bytes around it form a 2-byte code that
+    is turned into the line type index and counted with bincount.
+    """
+    import numpy as np
+
+    data = np.fromfile(filename, dtype=np.uint8)
+    spaces = np.flatnonzero(data == ord(" "))
+    opponents = data[spaces - 1].astype(np.intp) - ord("A")
+    players = data[spaces + 1].astype(np.intp) - ord("X")
+    if ((opponents < 0) | (opponents > 2)
+            | (players < 0) | (players > 2)).any():
+        raise ValueError("The strategy guide contains unknown lines.")
+
+    return np.bincount(3 * opponents + players,
+                       minlength=len(LINE_TYPES)).tolist()
+
+
+def score_line_type_histogram(histogram: list[int], score_table: list[int]):
+    return sum(count * score for count, score in zip(histogram, score_table))
+
+
+def evaluate_strategy_guide(filename: str, use_numpy: bool = False):
+    """Scores the strategy guide for both parts from a single pass over the
+    file, by counting the line types once and weighting the counts with the
+    precomputed score tables.
+
+    Returns:
+        tuple[int, int]: The total score for part 1 and part 2.
+    """
+    if use_numpy:
+        histogram = count_line_types_numpy(filename)
+    else:
+        histogram = count_line_types(filename)
+
+    return (score_line_type_histogram(histogram, SCORE_TABLE_P1),
+            score_line_type_histogram(histogram, SCORE_TABLE_P2))
+
+
+def generate_strategy_translations(values: list, allow_repeats: bool = False):
+    """Yields every translation table that keeps A/B/C as the opponent's
+    choices and maps X/Y/Z to _values_, either choices or outcomes. Each
+    value is used once unless _allow_repeats_ is set.
+    """
+    if allow_repeats:
+        assignments = product(values, repeat=3)
+    else:
+        assignments = permutations(values)
+    for assignment in assignments:
+        translations = {key: STRATEGY_TRANSLATIONS_P1[key] for key in "ABC"}
+        translations.update(zip("XYZ", assignment))
+        yield translations
+
+
+def score_all_strategy_translations(histogram: list[int],
+                                    allow_repeats: bool = False):
+    """Scores every interpretation of X/Y/Z, as the player's choice like in
+    part 1 and as the desired outcome like in part 2, against a line type
+    histogram from count_line_types. The file is only read once however
+    many interpretations there are.
+
+    Returns:
+        list[tuple[int, str, dict]]: The score, "choice" or "outcome", and
+                                     the translation table of every
+                                     interpretation.
+    """
+    scored_translations = []
+    for translations in generate_strategy_translations(list(Choice),
+                                                       allow_repeats):
+        score_table = create_score_table_p1(translations)
+        scored_translations.append(
+            (score_line_type_histogram(histogram, score_table), "choice",
+             translations)
+        )
+    for translations in generate_strategy_translations(list(MatchOutcome),
+                                                       allow_repeats):
+        score_table = create_score_table_p2(translations)
+        scored_translations.append(
+            (score_line_type_histogram(histogram, score_table), "outcome",
+             translations)
+        )
+
+    return scored_translations
+
+
+def find_best_strategy_translation(histogram: list[int], worst: bool = False,
+                                   allow_repeats: bool = False):
+    """Finds the interpretation of X/Y/Z that gives the highest total score,
+    or the lowest if _worst_ is set. See score_all_strategy_translations.
+    """
+    scored_translations = score_all_strategy_translations(histogram,
+                                                          allow_repeats)
+    pick = min if worst else max
+    return pick(scored_translations, key=lambda scored: scored[0])
+
+
+def find_shard_boundaries(filename: str, num_shards: int):
+    """Splits the file into _num_shards_ byte ranges of roughly equal size
+    that start and end on line boundaries.
+
+    Returns:
+        list[tuple[int, int]]: Start and end offset of each non-empty shard.
+    """
+    file_size = os.path.getsize(filename)
+    boundaries = [0]
+    with open(filename, "rb") as f:
+        for i in range(1, num_shards):
+            offset = max(file_size * i // num_shards, boundaries[-1])
+            if offset == 0:
+                continue
+            # Move to the start of the first line beginning at or after
+            # the offset.
+            f.seek(offset - 1)
+            f.readline()
+            boundaries.append(min(f.tell(), file_size))
+    boundaries.append(file_size)
+
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:])
+            if start < end]
+
+
+def count_non_blank_lines(block: bytes) -> int:
+    """Counts the lines of _block_ that are not blank, where _block_ starts
+    at the beginning of a line.
+    """
+    if b"\r" in block:
+        block = block.replace(b"\r", b"")
+    lines = block.count(b"\n")
+    if block and not block.endswith(b"\n"):
+        lines += 1
+    blank_lines = block.startswith(b"\n")
+    if b"\n\n" in block:
+        blank_lines += len(re.findall(b"(?<=\n)\n", block))
+    return lines - blank_lines
+
+
+def count_line_types_in_range(filename: str, start: int, end: int,
+                              block_size: int = 2**24) -> list[int]:
+    """Counts the line types in the byte range [_start_, _end_) of the file,
+    reading it in blocks so memory stays bounded by _block_size_. Letters
+    only occur in their own column, so each line type can be counted as a
+    substring without splitting the lines. A line that is not one of the
+    line types would go uncounted, so the counts of each block are checked
+    against its number of lines.
+    """
+    line_type_patterns = [line_type.encode() for line_type in LINE_TYPES]
+    histogram = [0] * len(LINE_TYPES)
+    with open(filename, "rb") as f:
+        f.seek(start)
+        remaining = end - start
+        carry = b""
+        while remaining > 0:
+            block = f.read(min(block_size, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            block = carry + block
+            if remaining > 0:
+                cut = block.rfind(b"\n") + 1
+                block, carry = block[:cut], block[cut:]
+            block_histogram = [block.count(pattern)
+                               for pattern in line_type_patterns]
+            if sum(block_histogram) != count_non_blank_lines(block):
+                raise ValueError("The strategy guide contains unknown "
+                                 "lines.")
+            for i, count in enumerate(block_histogram):
+                histogram[i] += count
+
+    return histogram
+
+
+def score_strategy_guide_shard(shard: tuple[str, int, int]):
+    histogram = count_line_types_in_range(*shard)
+    return (score_line_type_histogram(histogram, SCORE_TABLE_P1),
+            score_line_type_histogram(histogram, SCORE_TABLE_P2),
+            sum(histogram))
+
+
+def evaluate_strategy_guide_sharded(filename: str, num_processes: int = None,
+                                    shards_per_process: int = 4,
+                                    progress=None):
+    """Scores the strategy guide for both parts by splitting the file into
+    shards on line boundaries and scoring each shard in a worker process.
+
+    Args:
+        filename (str): The strategy guide.
+        num_processes (int): Number of worker processes, defaults to the
+                             number of CPUs.
+        shards_per_process (int): More shards than processes evens out the
+                                  load and gives more frequent progress.
+        progress (callable): Called as progress(rounds, rounds_per_second)
+                             each time a shard has been scored.
+
+    Returns:
+        tuple[int, int]: The total score for part 1 and part 2.
+    """
+    if num_processes is None:
+        num_processes = cpu_count()
+    shards = [(filename, start, end) for start, end in find_shard_boundaries(
+        filename, num_processes * shards_per_process
+    )]
+
+    total_scores = [0, 0]
+    rounds = 0
+    start_time = time.perf_counter()
+
+    def add_partial_result(partial_result):
+        nonlocal rounds
+        total_scores[0] += partial_result[0]
+        total_scores[1] += partial_result[1]
+        rounds += partial_result[2]
+        if progress is not None:
+            elapsed = time.perf_counter() - start_time
+            progress(rounds, rounds / elapsed if elapsed else 0.0)
+
+    if num_processes == 1:
+        for shard in shards:
+            add_partial_result(score_strategy_guide_shard(shard))
+    else:
+        with Pool(num_processes) as p:
+            for partial_result in p.imap_unordered(score_strategy_guide_shard,
+                                                   shards):
+                add_partial_result(partial_result)
+
+    return tuple(total_scores)
+
+
 def part_1():
     total_score = evaluate_strategy_guide_p1("day_02/input.txt")
     print("Part 1 - Total score when following the strategy guide is "
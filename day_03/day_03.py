@@ -1,7 +1,131 @@
+from itertools import islice
+import string
+from typing import Iterable
+
+
 def char_to_priority(c: str):
     return ord(c)-96 if c.islower() else ord(c)-64+26
 
 
+def create_priority_bit_table():
+    """Maps every byte value to a bitmask with the bit of the item's priority
+    set, or to 0 for bytes that are not items.
+    """
+    priority_bits = [0] * 256
+    for c in string.ascii_letters:
+        priority_bits[ord(c)] = 1 << char_to_priority(c)
+    return priority_bits
+
+
+PRIORITY_BITS = create_priority_bit_table()
+
+
+def items_to_bitmask(items: str | bytes) -> int:
+    """Encodes the item types in _items_ as an integer where bit _p_ is set
+    if an item with priority _p_ is present.
+    """
+    if isinstance(items, str):
+        items = items.encode()
+    bitmask = 0
+    for item in items:
+        bitmask |= PRIORITY_BITS[item]
+    return bitmask
+
+
+def bitmask_to_priority(bitmask: int) -> int:
+    """Priority of the highest item type in the bitmask, which is the only
+    one when the bitmask comes from an intersection with a single common
+    item.
+    """
+    if bitmask == 0:
+        raise ValueError("The rucksacks have no item in common.")
+    return bitmask.bit_length() - 1
+
+
+def sum_compartment_priorities(lines: Iterable[str | bytes]) -> int:
+    """Sums the priority of the item found in both compartments of every
+    rucksack, where the compartments are the two halves of a line. The
+    lines may be text or bytes.
+    """
+    priority_sum = 0
+    for line in lines:
+        line = line.strip()
+        middle = len(line) // 2
+        common = items_to_bitmask(line[:middle]) \
+            & items_to_bitmask(line[middle:])
+        priority_sum += bitmask_to_priority(common)
+    return priority_sum
+
+
+def find_group_badges(lines: Iterable[str | bytes], group_size: int = 3):
+    """Finds the badge, the item shared by every rucksack, of each group of
+    _group_size_ consecutive lines. The lines are consumed lazily so only
+    one group is held in memory, which works for any iterable of text or
+    bytes lines such as an open file or a pipe.
+
+    Yields:
+        int: The priority of each group's badge.
+    """
+    lines = iter(lines)
+    while True:
+        group = list(islice(lines, group_size))
+        if not group:
+            return
+        if len(group) < group_size:
+            raise ValueError(f"The last group only has {len(group)} of "
+                             f"{group_size} rucksacks.")
+        common = -1
+        for line in group:
+            common &= items_to_bitmask(line.strip())
+        yield bitmask_to_priority(common)
+
+
+def find_group_badges_numpy(lines: Iterable[str | bytes],
+                            group_size: int = 3,
+                            groups_per_batch: int = 2**16):
+    """Same as find_group_badges, but finds the badges of
+    _groups_per_batch_ groups at a time from a boolean presence matrix of
+    shape (groups, group_size, 52).
+    """
+    import numpy as np
+
+    byte_to_priority = np.zeros(256, dtype=np.intp)
+    for c in string.ascii_letters:
+        byte_to_priority[ord(c)] = char_to_priority(c)
+
+    lines = iter(lines)
+    while True:
+        batch = [line.strip() for line in
+                 islice(lines, group_size * groups_per_batch)]
+        batch = [line.encode() if isinstance(line, str) else line
+                 for line in batch]
+        if not batch:
+            return
+        if len(batch) % group_size:
+            raise ValueError(f"The last group only has "
+                             f"{len(batch) % group_size} of {group_size} "
+                             "rucksacks.")
+
+        items = np.frombuffer(b"".join(batch), dtype=np.uint8)
+        rucksack_of_item = np.repeat(np.arange(len(batch)),
+                                     [len(line) for line in batch])
+        presence = np.zeros((len(batch), 53), dtype=bool)
+        presence[rucksack_of_item, byte_to_priority[items]] = True
+        presence = presence[:, 1:].reshape(-1, group_size, 52)
+        common = presence.all(axis=1)
+        if not common.any(axis=1).all():
+            raise ValueError("A group has no item in common.")
+        yield from (common.argmax(axis=1) + 1).tolist()
+
+
+def sum_group_priorities(lines: Iterable[str | bytes],
+                         group_size: int = 3) -> int:
+    """Sums the priority of the item shared by every rucksack in each group
+    of _group_size_ consecutive lines.
+    """
+    return sum(find_group_badges(lines, group_size))
+
+
 def part_1():
     with open("day_03/input.txt") as f:
         priorities_of_duplicates = []
@@ -19,20 +143,9 @@ def part_1():
 
 
 def part_2():
-    with open("day_03/input.txt") as f:
-        lines = f.readlines()
-        priorities_of_commons = []
-        for i in range(0, len(lines), 3):
-            priorities_of_commons.append(
-                char_to_priority(
-                    set.intersection(
-                        set(lines[i].strip()),
-                        set(lines[i+1].strip()),
-                        set(lines[i+2].strip())
-                    ).pop()
-                )
-            )
-    print(f"Part 2 - The sum of priorities are {sum(priorities_of_commons)}")
+    with open("day_03/input.txt", "rb") as f:
+        sum_of_priorities = sum(find_group_badges(f, 3))
+    print(f"Part 2 - The sum of priorities are {sum_of_priorities}")
 
 
 def main():
@@ -43,7 +156,7 @@ def main():
     print(sum([ord(c)-96 if c.islower()else ord(c)-38 for c in[set.intersection(set(l[:len(l)//2]),set(l[len(l)//2:])).pop()for l in open("day_03/input.txt").readlines()]]))
 
     # Part 2 - (the shortest of) oneliner(s)
-    print(sum([ord(c)-96 if c.islower()else ord(c)-38 for c in[set.intersection(set(open("day_03/input.txt").readlines()[i].strip()),set(open("day_03/input.txt").readlines()[i+1].strip()),set(open("day_03/input.txt").readlines()[i+2].strip())).pop()for i in range(0, len(open("day_03/input.txt").readlines()),3)]]))
+    print(sum([ord(c)-96 if c.islower()else ord(c)-38 for c in[set.intersection(*map(set,map(str.strip,g))).pop()for g in zip(*[open("day_03/input.txt")]*3)]]))
 
 
 if __name__ == "__main__":
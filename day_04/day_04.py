@@ -1,4 +1,5 @@
-from typing import Tuple
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Tuple
 
 
 def is_subinterval(subinterval: Tuple[int, int],
@@ -18,6 +19,254 @@ def line_to_intervals(line: str):
             for unparsed_interval in unparsed_intervals]
 
 
+def intervals_from_lines(lines: Iterable[str]):
+    """Yields both assignments of every line, in order.
+    """
+    for line in lines:
+        yield from line_to_intervals(line)
+
+
+def coverage_segments(intervals: Iterable[Tuple[int, int]]):
+    """Sweeps over the sorted interval endpoints to find how many elves are
+    assigned to every section, without expanding the intervals into
+    sections. Uses O(n log n) time and O(n) memory for n intervals.
+
+    Yields:
+        tuple[int, int, int]: First section, last section and number of
+                              assigned elves of every run of sections with
+                              the same coverage, from the lowest to the
+                              highest assigned section.
+    """
+    events = []
+    for start, end in intervals:
+        events.append((start, 1))
+        events.append((end + 1, -1))
+    events.sort()
+
+    assigned = 0
+    i = 0
+    while i < len(events):
+        section = events[i][0]
+        while i < len(events) and events[i][0] == section:
+            assigned += events[i][1]
+            i += 1
+        if i < len(events):
+            yield section, events[i][0] - 1, assigned
+
+
+def analyze_section_coverage(intervals: Iterable[Tuple[int, int]]):
+    """Finds the peak number of elves assigned to the same section and the
+    coverage histogram from a single sweep, see coverage_segments.
+
+    Returns:
+        tuple[int, tuple[int, int], dict[int, int]]: The peak number of
+            simultaneously assigned elves, the first run of sections where
+            the peak occurs, and the number of sections per number of
+            assigned elves.
+    """
+    peak = 0
+    peak_sections = None
+    histogram = {}
+    for first, last, assigned in coverage_segments(intervals):
+        histogram[assigned] = histogram.get(assigned, 0) + last - first + 1
+        if assigned > peak:
+            peak = assigned
+            peak_sections = (first, last)
+
+    return peak, peak_sections, dict(sorted(histogram.items()))
+
+
+class AssignmentIndex:
+    """Static interval tree over section assignments, answering which
+    assignments cover a section or intersect a range in O(log n + k) for k
+    matching assignments.
+
+    Every node keeps the intervals containing its center, once sorted by
+    start and once by end, intervals entirely left of the center go to the
+    left subtree and the ones right of it to the right subtree. Assignments
+    are referred to by their index in _intervals_.
+    """
+    def __init__(self, intervals: Iterable[Tuple[int, int]]) -> None:
+        self.intervals = [tuple(interval) for interval in intervals]
+        self.__ids_by_start = sorted(range(len(self.intervals)),
+                                     key=lambda i: self.intervals[i][0])
+        self.__sorted_starts = [self.intervals[i][0]
+                                for i in self.__ids_by_start]
+
+        self.__centers = []
+        self.__left = []
+        self.__right = []
+        self.__node_ids_by_start = []
+        self.__node_ids_by_end = []
+        self.__root = self.__build(list(range(len(self.intervals))))
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]):
+        """Indexes both assignments of every line. Assignment _i_ belongs to
+        the first elf of line i // 2 if _i_ is even and the second if odd.
+        """
+        return cls(intervals_from_lines(lines))
+
+    def __new_node(self, center: int, ids: list[int]):
+        self.__centers.append(center)
+        self.__left.append(None)
+        self.__right.append(None)
+        self.__node_ids_by_start.append(
+            sorted(ids, key=lambda i: self.intervals[i][0])
+        )
+        self.__node_ids_by_end.append(
+            sorted(ids, key=lambda i: self.intervals[i][1], reverse=True)
+        )
+        return len(self.__centers) - 1
+
+    def __build(self, ids: list[int]):
+        """Builds the tree iteratively and returns the root node, or None for
+        an empty index.
+        """
+        if not ids:
+            return None
+        root = None
+        # Each entry is the ids of a subtree and where to attach it
+        to_build = [(ids, None, None)]
+        while to_build:
+            ids, parent, children = to_build.pop()
+            endpoints = sorted(value for i in ids
+                               for value in self.intervals[i])
+            center = endpoints[len(endpoints) // 2]
+            left_ids = [i for i in ids if self.intervals[i][1] < center]
+            right_ids = [i for i in ids if self.intervals[i][0] > center]
+            center_ids = [i for i in ids
+                          if self.intervals[i][0] <= center
+                          <= self.intervals[i][1]]
+            node = self.__new_node(center, center_ids)
+            if parent is None:
+                root = node
+            else:
+                children[parent] = node
+            if left_ids:
+                to_build.append((left_ids, node, self.__left))
+            if right_ids:
+                to_build.append((right_ids, node, self.__right))
+
+        return root
+
+    def covering(self, section: int) -> list[int]:
+        """Returns the assignments that include _section_.
+        """
+        matches = []
+        node = self.__root
+        while node is not None:
+            center = self.__centers[node]
+            if section < center:
+                for i in self.__node_ids_by_start[node]:
+                    if self.intervals[i][0] > section:
+                        break
+                    matches.append(i)
+                node = self.__left[node]
+            elif section > center:
+                for i in self.__node_ids_by_end[node]:
+                    if self.intervals[i][1] < section:
+                        break
+                    matches.append(i)
+                node = self.__right[node]
+            else:
+                matches.extend(self.__node_ids_by_start[node])
+                break
+
+        return matches
+
+    def intersecting(self, start: int, end: int) -> list[int]:
+        """Returns the assignments that share at least one section with the
+        range [_start_, _end_]. Those are the ones covering _start_ plus the
+        ones starting inside (_start_, _end_].
+        """
+        if end < start:
+            return []
+        matches = self.covering(start)
+        first = bisect_right(self.__sorted_starts, start)
+        last = bisect_left(self.__sorted_starts, end + 1)
+        matches.extend(self.__ids_by_start[first:last])
+        return matches
+
+
+def parse_assignments_numpy(data: bytes):
+    """Parses section assignments into an N x 4 array with one row of
+    (a_start, a_end, b_start, b_end) per line. Each number is assembled one
+    digit place at a time for all numbers at once, counting back from the
+    last digit of each number.
+    """
+    import numpy as np
+
+    data = np.frombuffer(data, dtype=np.uint8)
+    is_digit = (data >= ord("0")) & (data <= ord("9"))
+    # Pad with non-digits so numbers at the edges get a start and an end
+    edges = np.diff(np.concatenate(([False], is_digit, [False])).view(np.int8))
+    number_starts = np.flatnonzero(edges == 1)
+    number_ends = np.flatnonzero(edges == -1) - 1
+    number_lengths = number_ends - number_starts + 1
+    if len(number_starts) % 4:
+        raise ValueError("Every line must contain two intervals.")
+
+    numbers = np.zeros(len(number_starts), dtype=np.int64)
+    for place in range(int(number_lengths.max(initial=0))):
+        digits = data[number_ends - place].astype(np.int64) - ord("0")
+        digits[number_lengths <= place] = 0
+        numbers += digits * 10**place
+
+    return numbers.reshape(-1, 4)
+
+
+def count_subintervals_and_overlaps(assignments):
+    """Counts the assignment pairs where one interval contains the other and
+    the pairs that overlap at all, with vectorized comparisons over every
+    pair at once.
+
+    Args:
+        assignments (numpy.ndarray): N x 4 array from
+                                     parse_assignments_numpy.
+
+    Returns:
+        tuple[int, int]: Pairs with a subinterval and pairs with an overlap.
+    """
+    a_start, a_end, b_start, b_end = assignments.T
+    has_subinterval = (((a_start >= b_start) & (a_end <= b_end))
+                       | ((b_start >= a_start) & (b_end <= a_end)))
+    has_overlap = (a_start <= b_end) & (b_start <= a_end)
+    return int(has_subinterval.sum()), int(has_overlap.sum())
+
+
+def count_subintervals_and_overlaps_in_file(filename: str,
+                                            block_size: int = 2**26):
+    """Answers both parts from a single pass over the file. The file is read
+    in blocks of about _block_size_ bytes, cut at line boundaries, so memory
+    stays bounded however many assignment pairs there are.
+    """
+    subintervals = 0
+    overlaps = 0
+    carry = b""
+    with open(filename, "rb") as f:
+        while True:
+            block = f.read(block_size)
+            if block:
+                block = carry + block
+                cut = block.rfind(b"\n") + 1
+                block, carry = block[:cut], block[cut:]
+                if not block:
+                    # No line ends in this block yet, keep reading.
+                    continue
+            else:
+                block, carry = carry, b""
+                if not block:
+                    break
+            block_counts = count_subintervals_and_overlaps(
+                parse_assignments_numpy(block)
+            )
+            subintervals += block_counts[0]
+            overlaps += block_counts[1]
+
+    return subintervals, overlaps
+
+
 def part_1():
     assignments_with_subintervals = 0
     for line in open("day_04/input.txt"):
@@ -0,0 +1,87 @@
+"""Day 05: Supply Stacks - crate mover benchmark
+
+Compares the list and dict based crate movers with the bytearray stacks
+and packed instructions on a generated input. Run it from the repository
+root:
+
+    python -m day_05.benchmark_day_05 --instructions 1000000
+"""
+import argparse
+import copy
+import os
+import tempfile
+import time
+
+from day_05.day_05 import (
+    bytearray_stack_tops_to_string,
+    get_instructions_from_file,
+    get_starting_state_from_file,
+    pack_instructions,
+    perform_instructions_on_stacks,
+    perform_packed_instructions,
+    stack_tops_to_string,
+    stacks_to_bytearrays,
+    trace_stack_tops,
+)
+from generate_inputs import write_input
+
+
+def time_engine(engine):
+    start = time.perf_counter()
+    result = engine()
+    return result, time.perf_counter() - start
+
+
+def run_benchmark(num_instructions: int, seed: int = 0,
+                  crates_per_stack: int = 100, max_move: int = 50):
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "input.txt")
+        write_input(5, filename, num_instructions, seed,
+                    crates_per_stack=crates_per_stack, max_move=max_move)
+        starting_state = get_starting_state_from_file(filename)
+        instructions = get_instructions_from_file(filename)
+
+    packed_instructions, packing_time = time_engine(
+        lambda: pack_instructions(instructions)
+    )
+    packed_size = len(packed_instructions) * packed_instructions.itemsize
+    print(f"{num_instructions} instructions, packed in "
+          f"{packing_time:.3f} s ({packed_size} bytes)")
+
+    for version in (9000, 9001):
+        engines = {
+            "list stacks, dict instructions": lambda: stack_tops_to_string(
+                perform_instructions_on_stacks(
+                    instructions, copy.deepcopy(starting_state), version
+                )
+            ),
+            "bytearray stacks, packed instructions":
+                lambda: bytearray_stack_tops_to_string(
+                    perform_packed_instructions(
+                        packed_instructions,
+                        stacks_to_bytearrays(starting_state), version
+                    )
+                ),
+            "backward tracer": lambda: trace_stack_tops(
+                instructions, starting_state, version
+            ),
+        }
+        for name, engine in engines.items():
+            tops, elapsed = time_engine(engine)
+            print(f"CrateMover {version} - {name:40} {elapsed:8.3f} s "
+                  f"[{tops}]")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--instructions", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--crates-per-stack", type=int, default=100)
+    parser.add_argument("--max-move", type=int, default=50)
+    arguments = parser.parse_args()
+    run_benchmark(arguments.instructions, arguments.seed,
+                  arguments.crates_per_stack, arguments.max_move)
+
+
+if __name__ == "__main__":
+    main()
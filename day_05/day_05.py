@@ -1,5 +1,8 @@
 """Day 05: Supply Stacks
 """
+from array import array
+import sys
+from typing import Iterable
 
 
 def get_starting_state_from_file(filename: str):
@@ -93,6 +96,185 @@ def perform_instructions_on_stacks(
     return stacks
 
 
+def stacks_to_bytearrays(stacks: list[list[str]]) -> list[bytearray]:
+    """Stores every stack as a bytearray with one byte per crate, bottom
+    first, which is far more compact than a list of one character strings.
+    """
+    return [bytearray("".join(stack), "ascii") for stack in stacks]
+
+
+def pack_instructions(instructions: list[dict]) -> array:
+    """Packs the instructions into a flat integer array of
+    (move, from, to) triples, with zero-indexed stacks.
+    """
+    packed = array("I")
+    for instruction in instructions:
+        packed.extend((instruction["move"], instruction["from"]-1,
+                       instruction["to"]-1))
+    return packed
+
+
+def perform_packed_instructions(
+        packed_instructions: array,
+        stacks: list[bytearray],
+        cratemover_version: int = 9000):
+    """Same as perform_instructions_on_stacks, but for packed instructions
+    and bytearray stacks. Each instruction moves its crates as one slice
+    and removes them from the source in place, the 9000 reversing the
+    slice since it moves one crate at a time.
+    """
+    reverse = cratemover_version == 9000
+    instructions = iter(packed_instructions)
+    for move, source, target in zip(instructions, instructions,
+                                    instructions):
+        move_crates(stacks, move, source, target, reverse)
+
+    return stacks
+
+
+def move_crates(stacks: list[bytearray], move: int, source: int, target: int,
+                reverse: bool):
+    if move == 0 or source == target:
+        return
+    source_stack = stacks[source]
+    crates = source_stack[-move:]
+    del source_stack[-move:]
+    if reverse:
+        crates.reverse()
+    stacks[target] += crates
+
+
+class StackReplay:
+    """Random access to the stacks after any number of performed
+    instructions. A compact snapshot of the stacks is stored every
+    _checkpoint_interval_ instructions, a query restores the closest earlier
+    snapshot and performs the remaining instructions from there. A smaller
+    interval gives faster queries at the cost of more snapshots.
+    """
+    def __init__(self, stacks: list[list[str]], instructions: list[dict],
+                 cratemover_version: int = 9000,
+                 checkpoint_interval: int = 1000) -> None:
+        if checkpoint_interval < 1:
+            raise ValueError("The checkpoint interval must be at least 1.")
+        self.packed_instructions = pack_instructions(instructions)
+        self.reverse = cratemover_version == 9000
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoints = []
+
+        stacks = stacks_to_bytearrays(stacks)
+        for i in range(len(self) + 1):
+            if i % checkpoint_interval == 0:
+                self.checkpoints.append(tuple(bytes(stack)
+                                              for stack in stacks))
+            if i < len(self):
+                self.__perform_instruction(i, stacks)
+
+    def __len__(self):
+        return len(self.packed_instructions) // 3
+
+    def __perform_instruction(self, index: int, stacks: list[bytearray]):
+        move, source, target = self.packed_instructions[3*index:3*index+3]
+        move_crates(stacks, move, source, target, self.reverse)
+
+    def stacks_after(self, num_performed: int) -> list[bytearray]:
+        """Returns the stacks after the first _num_performed_ instructions.
+        """
+        if not 0 <= num_performed <= len(self):
+            raise IndexError(f"There are only {len(self)} instructions.")
+        checkpoint = num_performed // self.checkpoint_interval
+        stacks = [bytearray(stack) for stack in self.checkpoints[checkpoint]]
+        for i in range(checkpoint * self.checkpoint_interval, num_performed):
+            self.__perform_instruction(i, stacks)
+
+        return stacks
+
+
+def perform_instructions_from_stream(
+        lines: Iterable[str],
+        cratemover_versions: tuple[int] = (9000, 9001)):
+    """Reads the drawing and then performs every instruction as soon as its
+    line has been read, for each of the crate movers at once. Only the
+    stacks are kept in memory, so any number of instructions can be piped
+    through it.
+
+    Returns:
+        list[list[bytearray]]: The final stacks for each crate mover.
+    """
+    lines = iter(lines)
+    drawing = []
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if len(line) == 0:
+            break
+        drawing.append(line)
+    starting_state = get_stacks_data_from_line_rows(drawing)
+
+    movers = [(stacks_to_bytearrays(starting_state), version == 9000)
+              for version in cratemover_versions]
+    for line in lines:
+        split_line = line.split()
+        if not split_line:
+            continue
+        move, source, target = (int(split_line[1]), int(split_line[3])-1,
+                                int(split_line[5])-1)
+        for stacks, reverse in movers:
+            move_crates(stacks, move, source, target, reverse)
+
+    return [stacks for stacks, _ in movers]
+
+
+def bytearray_stack_tops_to_string(stacks: list[bytearray]):
+    return "".join(chr(stack[-1]) if len(stack) else " " for stack in stacks)
+
+
+def trace_stack_tops(
+        instructions: list[dict],
+        stacks: list[list[str]],
+        cratemover_version: int = 9000):
+    """Finds what stack_tops_to_string would return after performing the
+    instructions, without moving any crates. Only the stack heights are
+    played forward. Then, walking the instructions backwards, the crate on
+    top of each final stack is traced back to its position in the starting
+    stacks. The cost is O(instructions * stacks) however many crates each
+    instruction moves.
+    """
+    heights = [len(stack) for stack in stacks]
+    for instruction in instructions:
+        heights[instruction["from"]-1] -= instruction["move"]
+        heights[instruction["to"]-1] += instruction["move"]
+        if heights[instruction["from"]-1] < 0:
+            raise ValueError("Instruction moves more crates than the stack "
+                             f"holds: {instruction}")
+
+    # (stack, position) of each final top crate, or None for empty stacks
+    tracked = [(i, height-1) if height else None
+               for i, height in enumerate(heights)]
+    for instruction in reversed(instructions):
+        move = instruction["move"]
+        source = instruction["from"] - 1
+        target = instruction["to"] - 1
+        if source == target:
+            continue
+        # Rewind the heights to what they were before the instruction
+        heights[target] -= move
+        heights[source] += move
+        for i, position in enumerate(tracked):
+            if position is None or position[0] != target \
+               or position[1] < heights[target]:
+                continue
+            offset = position[1] - heights[target]
+            if cratemover_version == 9000:
+                # Crates are moved one at a time, which reverses their order
+                tracked[i] = (source, heights[source] - 1 - offset)
+            else:
+                tracked[i] = (source, heights[source] - move + offset)
+
+    return "".join(
+        " " if position is None else stacks[position[0]][position[1]]
+        for position in tracked
+    )
+
+
 def stack_tops_to_string(columns: list[str]):
     return "".join([c[-1] if len(c) else " " for c in columns])
 
@@ -115,9 +297,27 @@ def part_2():
           f"{stack_tops_to_string(end_state)}")
 
 
+def stream_input(filename: str):
+    """Solves both parts in a single pass over _filename_, where "-" reads
+    the input from stdin.
+    """
+    if filename == "-":
+        end_states = perform_instructions_from_stream(sys.stdin)
+    else:
+        with open(filename) as f:
+            end_states = perform_instructions_from_stream(f)
+    print("Part 1 - Supplies on top of stacks: "
+          f"{bytearray_stack_tops_to_string(end_states[0])}")
+    print("Part 2 - Supplies on top of stacks: "
+          f"{bytearray_stack_tops_to_string(end_states[1])}")
+
+
 def main():
-    part_1()
-    part_2()
+    if len(sys.argv) > 1:
+        stream_input(sys.argv[1])
+    else:
+        part_1()
+        part_2()
 
 
 if __name__ == "__main__":
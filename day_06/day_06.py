@@ -1,5 +1,7 @@
 """Day 06: Tuning Trouble
 """
+import sys
+from typing import BinaryIO, Iterable
 
 
 def find_first_unique_sequence_index(
@@ -17,14 +19,205 @@ def find_first_unique_sequence_index(
     Returns:
         int: The ending index of the unique sequence.
     """
-    for i in range(len(characters)-sequence_len):
-        char_set = set(characters[i:i+sequence_len])
-        if len(char_set) == sequence_len:
-            return i+sequence_len
+    # The window ending at i always holds unique characters. When a
+    # character reappears inside the window, the window starts over right
+    # after its last occurrence. Each character is visited once, so the
+    # search is O(n) for any sequence length.
+    last_seen = {}
+    window_start = 0
+    for i, character in enumerate(characters):
+        previous_index = last_seen.get(character, -1)
+        if previous_index >= window_start:
+            window_start = previous_index + 1
+        last_seen[character] = i
+        if i - window_start + 1 == sequence_len:
+            return i+1
     raise ValueError(f"No unique sequence of length {sequence_len} "
                      "found in the given character string.")
 
 
+def find_first_unique_sequence_indices(
+    characters: str,
+    sequence_lens: Iterable[int]
+):
+    """Finds the endpoint indices for the first unique sequences of every
+    length in _sequence_lens_ with a single pass over the string. A unique
+    sequence also contains unique sequences of every shorter length, so
+    the lengths are found in increasing order and the scan stops as soon
+    as the longest one is found.
+
+    Args:
+        characters (str): String in which the unique sequences are located.
+        sequence_lens (Iterable[int]): The lengths of the unique sequences
+                                       that should be found.
+
+    Returns:
+        dict[int, int]: The ending index of the unique sequence of each
+                        length.
+    """
+    pending_lens = sorted(set(sequence_lens), reverse=True)
+    indices = {}
+    last_seen = {}
+    window_start = 0
+    for i, character in enumerate(characters):
+        if not pending_lens:
+            break
+        previous_index = last_seen.get(character, -1)
+        if previous_index >= window_start:
+            window_start = previous_index + 1
+        last_seen[character] = i
+        # The window grows by at most one character per step, so at most
+        # one pending length can be reached here.
+        if i - window_start + 1 == pending_lens[-1]:
+            indices[pending_lens.pop()] = i+1
+    if pending_lens:
+        raise ValueError("No unique sequences of lengths "
+                         f"{sorted(pending_lens)} found in the given "
+                         "character string.")
+    return indices
+
+
+def find_first_unique_sequence_indices_numpy(
+    characters: str | bytes,
+    sequence_lens: Iterable[int]
+):
+    """Same result as find_first_unique_sequence_indices, computed with
+    vectorized NumPy operations for very long datastreams.
+
+    A stable sort by byte value puts every occurrence of a byte right after
+    its previous occurrence, which gives the previous occurrence of every
+    position at once. The running maximum of those is the last repeated
+    position before each index, so the longest unique sequence ending at
+    each index follows directly and answers every length in one go.
+
+    Args:
+        characters (str | bytes): Datastream in which the unique sequences
+                                  are located.
+        sequence_lens (Iterable[int]): The lengths of the unique sequences
+                                       that should be found.
+
+    Returns:
+        dict[int, int]: The ending index of the unique sequence of each
+                        length.
+    """
+    import numpy as np
+
+    if isinstance(characters, str):
+        characters = characters.encode()
+    data = np.frombuffer(characters, dtype=np.uint8)
+
+    order = np.argsort(data, kind="stable")
+    is_repeat = data[order[1:]] == data[order[:-1]]
+    previous_indices = np.full(len(data), -1, dtype=np.int64)
+    previous_indices[order[1:][is_repeat]] = order[:-1][is_repeat]
+    unique_lens = (np.arange(len(data))
+                   - np.maximum.accumulate(previous_indices))
+
+    # The unique sequence grows by at most one per index, so the first
+    # index where the longest one so far reaches a length ends a unique
+    # sequence of exactly that length.
+    longest_so_far = np.maximum.accumulate(unique_lens)
+    sequence_lens = sorted(set(sequence_lens))
+    ends = np.searchsorted(longest_so_far, sequence_lens)
+    missing_lens = [sequence_len
+                    for sequence_len, end in zip(sequence_lens, ends)
+                    if end == len(data) or sequence_len < 1]
+    if missing_lens:
+        raise ValueError("No unique sequences of lengths "
+                         f"{missing_lens} found in the given "
+                         "character string.")
+    return {sequence_len: int(end)+1
+            for sequence_len, end in zip(sequence_lens, ends)}
+
+
+class MarkerDetector:
+    """Finds unique sequences in a datastream that arrives in chunks of any
+    size. Only the start of the current unique sequence and the last
+    offset of every byte value are kept between chunks, so the memory use
+    does not grow with the datastream.
+    """
+
+    def __init__(self, sequence_lens: Iterable[int]) -> None:
+        self.__pending_lens = sorted(set(sequence_lens), reverse=True)
+        self.__last_seen = [-1] * 256
+        self.__window_start = 0
+        self.__offset = 0
+
+    @property
+    def pending_lens(self):
+        return sorted(self.__pending_lens)
+
+    def feed(self, chunk: bytes):
+        """Continues the search with the next _chunk_ of the datastream.
+
+        Args:
+            chunk (bytes): The bytes following the previously fed chunks.
+
+        Returns:
+            list[tuple[int, int]]: The sequence lengths whose first unique
+                                   sequence ends in this chunk, together
+                                   with their ending index in the whole
+                                   datastream.
+        """
+        found = []
+        pending_lens = self.__pending_lens
+        last_seen = self.__last_seen
+        window_start = self.__window_start
+        offset = self.__offset
+        for i, byte in enumerate(chunk, offset):
+            if not pending_lens:
+                break
+            if last_seen[byte] >= window_start:
+                window_start = last_seen[byte] + 1
+            last_seen[byte] = i
+            if i - window_start + 1 == pending_lens[-1]:
+                found.append((pending_lens.pop(), i+1))
+        self.__window_start = window_start
+        self.__offset = offset + len(chunk)
+        return found
+
+
+def stream_markers(
+    stream: BinaryIO,
+    sequence_lens: Iterable[int],
+    chunk_size: int = 2**16
+):
+    """Reads _stream_ in chunks of _chunk_size_ bytes until every unique
+    sequence has been found.
+
+    Yields:
+        tuple[int, int]: A sequence length and the ending index of its
+                         first unique sequence, as soon as it is found.
+    """
+    # read1 returns whatever a pipe already holds instead of waiting for a
+    # full chunk, so markers are reported as soon as their bytes arrive.
+    read = getattr(stream, "read1", stream.read)
+    detector = MarkerDetector(sequence_lens)
+    while detector.pending_lens:
+        chunk = read(chunk_size)
+        if not chunk:
+            raise ValueError("No unique sequences of lengths "
+                             f"{detector.pending_lens} found in the "
+                             "datastream.")
+        yield from detector.feed(chunk)
+
+
+def stream_input(filename: str):
+    """Solves both parts while reading _filename_ in chunks, where "-"
+    reads the datastream from stdin.
+    """
+    def print_markers(stream: BinaryIO):
+        for sequence_len, index in stream_markers(stream, (4, 14)):
+            print(f"The first occuring unique sequence of length "
+                  f"{sequence_len} ends at index {index}.", flush=True)
+
+    if filename == "-":
+        print_markers(sys.stdin.buffer)
+    else:
+        with open(filename, "rb") as f:
+            print_markers(f)
+
+
 def part_1():
     characters = open("day_06/input.txt").read().strip()
     index = find_first_unique_sequence_index(characters, 4)
@@ -40,8 +233,11 @@ def part_2():
 
 
 def main():
-    part_1()
-    part_2()
+    if len(sys.argv) > 1:
+        stream_input(sys.argv[1])
+    else:
+        part_1()
+        part_2()
 
 
 if __name__ == "__main__":
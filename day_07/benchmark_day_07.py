@@ -0,0 +1,87 @@
+"""Day 7: No Space Left On Device - directory sizing benchmark
+
+Parses a generated terminal transcript into a tree of Directory objects
+and into a FlatFileTree, and times sizing their directories. A depth
+bias close to 1 creates deep directory chains. Run it from the
+repository root:
+
+    python -m day_07.benchmark_day_07 --directories 1000000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from day_07.day_07 import (
+    find_value_closest_to_target,
+    parse_input,
+    parse_input_flat,
+)
+from generate_inputs import write_input
+
+
+def time_engine(engine):
+    start = time.perf_counter()
+    result = engine()
+    return result, time.perf_counter() - start
+
+
+def print_answers(subdir_sizes, total_size: int):
+    sum_of_filtered_sizes = sum(filter(lambda s: s < 100_000, subdir_sizes))
+    additional_space_needed = 30_000_000 - (70_000_000 - total_size)
+    closest_value = find_value_closest_to_target(subdir_sizes,
+                                                 additional_space_needed)
+    print(f"Total size {total_size}, part 1 {sum_of_filtered_sizes}, "
+          f"part 2 {closest_value}")
+
+
+def run_benchmark(num_directories: int, seed: int = 0,
+                  depth_bias: float = 0.5):
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "input.txt")
+        write_input(7, filename, num_directories, seed,
+                    depth_bias=depth_bias)
+        base_directory, parsing_time = time_engine(
+            lambda: parse_input(filename)
+        )
+        flat_tree, flat_parsing_time = time_engine(
+            lambda: parse_input_flat(filename)
+        )
+    print(f"{num_directories} directories")
+
+    print(f"{'Directory objects - parse_input':48} {parsing_time:8.3f} s")
+    subdir_sizes, sizing_time = time_engine(base_directory.get_subdir_sizes)
+    _, cached_sizing_time = time_engine(base_directory.get_subdir_sizes)
+    total_size, cached_time = time_engine(base_directory.get_size)
+    print(f"{'Directory objects - get_subdir_sizes':48} {sizing_time:8.3f} s")
+    print(f"{'Directory objects - get_subdir_sizes (cached)':48} "
+          f"{cached_sizing_time:8.3f} s")
+    print(f"{'Directory objects - get_size (cached)':48} "
+          f"{cached_time:8.3f} s")
+    print_answers(subdir_sizes, total_size)
+
+    print(f"{'FlatFileTree - parse_input_flat':48} "
+          f"{flat_parsing_time:8.3f} s")
+    directory_sizes, flat_sizing_time = time_engine(
+        flat_tree.get_directory_sizes
+    )
+    print(f"{'FlatFileTree - get_directory_sizes':48} "
+          f"{flat_sizing_time:8.3f} s")
+    array_size = sum(len(values) * values.itemsize
+                     for values in (flat_tree.parents, flat_tree.file_sizes))
+    print(f"FlatFileTree arrays take up {array_size} bytes")
+    print_answers(directory_sizes, directory_sizes[0])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--directories", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--depth-bias", type=float, default=0.5)
+    arguments = parser.parse_args()
+    run_benchmark(arguments.directories, arguments.seed,
+                  arguments.depth_bias)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,14 @@
 """Day 7: No Space Left On Device
 """
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
 from typing import Iterable, Tuple
 
 
 class File:
+    __slots__ = ("name", "size")
+
     def __init__(self, name, size) -> None:
         self.name = name
         self.size = int(size)
@@ -13,35 +18,56 @@ class File:
 
 
 class Directory:
+    __slots__ = ("name", "parent", "content", "__size", "__subdir_sizes")
+
     def __init__(self, name, parent=None) -> None:
         self.name = name
         self.parent = parent
         self.content = {}
+        self.__size = None
+        self.__subdir_sizes = None
 
     def get_subdir_sizes(self):
-        this_size, subdir_sizes = self.__get_subdir_sizes()
-        return [this_size] + subdir_sizes
-
-    def __get_subdir_sizes(self, sub_sizes=None):
-        if sub_sizes is None:
-            sub_sizes = []
-        dir_size = 0
-        for value in self.content.values():
-            if type(value) is Directory:
-                sub_dir_size, sub_sizes = value.__get_subdir_sizes(sub_sizes)
-                dir_size += sub_dir_size
-            elif type(value) is File:
-                dir_size += value.size
-        sub_sizes.append(dir_size)
-
-        return dir_size, sub_sizes
+        if self.__subdir_sizes is None:
+            self.__subdir_sizes = self.__compute_subdir_sizes()
+        return [self.__size] + self.__subdir_sizes
 
-    def get_size(self):
-        total_size = 0
-        for value in self.content.values():
-            total_size += value.get_size()
+    def __compute_subdir_sizes(self):
+        """Sizes every directory in this tree with an iterative post-order
+        traversal, so deep trees do not hit the recursion limit. The sizes
+        are cached on the directories, which assumes the tree is no longer
+        modified once it has been sized.
 
-        return total_size
+        Returns:
+            list[int]: The directory sizes in post-order, ending with the
+                       size of this directory.
+        """
+        sub_sizes = []
+        stack = [(self, iter(self.content.values()))]
+        dir_sizes = [0]
+        while stack:
+            directory, contents = stack[-1]
+            for value in contents:
+                if type(value) is Directory:
+                    stack.append((value, iter(value.content.values())))
+                    dir_sizes.append(0)
+                    break
+                elif type(value) is File:
+                    dir_sizes[-1] += value.size
+            else:
+                stack.pop()
+                dir_size = dir_sizes.pop()
+                directory.__size = dir_size
+                sub_sizes.append(dir_size)
+                if dir_sizes:
+                    dir_sizes[-1] += dir_size
+
+        return sub_sizes
+
+    def get_size(self):
+        if self.__size is None:
+            self.__subdir_sizes = self.__compute_subdir_sizes()
+        return self.__size
 
 
 def find_value_closest_to_target(iterable: Iterable, target: int):
@@ -50,6 +76,47 @@ def find_value_closest_to_target(iterable: Iterable, target: int):
     return closest_value
 
 
+class SizeIndex:
+    """Sorted directory sizes with prefix sums, built once to answer any
+    number of size queries in O(log n) each.
+    """
+
+    def __init__(self, sizes: Iterable[int]) -> None:
+        self.__sizes = sorted(sizes)
+        self.__prefix_sums = list(accumulate(self.__sizes, initial=0))
+
+    def __len__(self):
+        return len(self.__sizes)
+
+    def smallest_at_least(self, target: int):
+        """Same result as find_value_closest_to_target.
+
+        Returns:
+            int: The smallest size that is at least _target_.
+        """
+        i = bisect_left(self.__sizes, target)
+        if i == len(self.__sizes):
+            raise ValueError(f"No size of at least {target} in the index.")
+        return self.__sizes[i]
+
+    def sum_below(self, threshold: int):
+        """Returns:
+            int: The sum of the sizes that are less than _threshold_.
+        """
+        return self.__prefix_sums[bisect_left(self.__sizes, threshold)]
+
+    def smallest_to_free(self, total_disk_space: int, space_required: int):
+        """Finds the smallest directory to delete so that _space_required_
+        is free on a disk of _total_disk_space_. The largest size is the
+        base directory, which is the used space.
+
+        Returns:
+            int: The size of the directory to delete.
+        """
+        free_space = total_disk_space - self.__sizes[-1]
+        return self.smallest_at_least(space_required-free_space)
+
+
 class LineParser:
     def __init__(self) -> None:
         self.__base_directory = None
@@ -112,28 +179,141 @@ class LineParser:
             )
 
 
-def part_1():
-    lines = open("day_07/input.txt").readlines()
+def parse_input(filename: str) -> Directory:
+    lines = open(filename).readlines()
     parser = LineParser()
-    base_directory = parser.create_file_tree_from_lines(lines)
-    subdir_sizes = base_directory.get_subdir_sizes()
-    sum_of_filtered_sizes = sum(filter(lambda s: s < 100_000, subdir_sizes))
+    return parser.create_file_tree_from_lines(lines)
+
+
+class FlatFileTree:
+    """File tree stored in flat arrays instead of Directory objects. The
+    directories are numbered in the order they are found, starting with 0
+    for the base directory, and each one only takes up its parent index
+    and the size of the files directly inside it.
+    """
+
+    def __init__(self) -> None:
+        self.parents = array("q")
+        self.file_sizes = array("q")
+
+    def __len__(self):
+        return len(self.parents)
+
+    def add_directory(self, parent: int = -1):
+        self.parents.append(parent)
+        self.file_sizes.append(0)
+        return len(self.parents) - 1
+
+    def get_directory_sizes(self):
+        """Sums the sizes of every directory in one reverse pass. A
+        directory is always numbered after its parent, so its size is
+        complete by the time it is added to the parent.
+
+        Returns:
+            array: The size of every directory by its index. Unlike
+                   Directory.get_subdir_sizes, the base directory is only
+                   included once.
+        """
+        sizes = array("q", self.file_sizes)
+        parents = self.parents
+        for i in range(len(sizes)-1, 0, -1):
+            sizes[parents[i]] += sizes[i]
+
+        return sizes
+
+
+class FlatTreeParser:
+    """Builds a FlatFileTree while streaming the transcript line by line.
+    The children of a directory are only looked up by name while the
+    directory is on the current path, so only the directories on the path
+    keep a dict of their children.
+    """
+
+    def __init__(self) -> None:
+        self.__tree = FlatFileTree()
+        self.__listed = bytearray()
+        self.__path = []
+        self.__base_name = None
+        self.__skip_listing = False
+
+    def create_flat_tree_from_lines(self, lines: Iterable[str]):
+        for line in lines:
+            args = line.split()
+            if not args:
+                continue
+            if args[0] == "$":
+                self.__process_command(args[1:])
+            else:
+                self.__handle_ls_output(args)
+
+        return self.__tree
+
+    def __process_command(self, args):
+        command = args[0]
+        if command == "cd":
+            self.__run_cd_command(args[1])
+        elif command == "ls":
+            self.__run_ls_command()
+
+    def __add_directory(self, parent: int = -1):
+        self.__listed.append(False)
+        return self.__tree.add_directory(parent)
+
+    def __run_cd_command(self, argument: str):
+        if not self.__path:
+            self.__base_name = argument
+            self.__path.append((self.__add_directory(), {}))
+        elif argument == "..":
+            self.__path.pop()
+        elif argument == self.__base_name:
+            del self.__path[1:]
+        else:
+            children = self.__path[-1][1]
+            if children is None or argument not in children:
+                raise ValueError(f"Can not cd into {argument}, it has not "
+                                 "been listed on the current path.")
+            index = children[argument]
+            # The names inside a directory are forgotten when it is left,
+            # and listing it again would count its files twice.
+            self.__path.append((index, None if self.__listed[index] else {}))
+
+    def __run_ls_command(self):
+        index = self.__path[-1][0]
+        self.__skip_listing = self.__listed[index]
+        self.__listed[index] = True
+
+    def __handle_ls_output(self, ls_output: Tuple[str, str]):
+        if self.__skip_listing:
+            return
+        index, children = self.__path[-1]
+        if ls_output[0] == "dir":
+            children[ls_output[1]] = self.__add_directory(index)
+        else:
+            self.__tree.file_sizes[index] += int(ls_output[0])
+
+
+def parse_input_flat(filename: str) -> FlatFileTree:
+    with open(filename) as f:
+        parser = FlatTreeParser()
+        return parser.create_flat_tree_from_lines(f)
+
+
+def part_1():
+    base_directory = parse_input("day_07/input.txt")
+    size_index = SizeIndex(base_directory.get_subdir_sizes())
+    sum_of_filtered_sizes = size_index.sum_below(100_000)
     print("Part 1 - The sum of directory sizes where the size is less than "
           f"100 000 is {sum_of_filtered_sizes}.")
 
 
 def part_2():
-    lines = open("day_07/input.txt").readlines()
-    parser = LineParser()
-    base_directory = parser.create_file_tree_from_lines(lines)
-    subdir_sizes = base_directory.get_subdir_sizes()
+    base_directory = parse_input("day_07/input.txt")
+    size_index = SizeIndex(base_directory.get_subdir_sizes())
 
     total_disk_space = 70_000_000
     space_required_for_update = 30_000_000
-    free_space = total_disk_space - base_directory.get_size()
-    additional_space_needed = (space_required_for_update-free_space)
-    closest_value = find_value_closest_to_target(subdir_sizes,
-                                                 additional_space_needed)
+    closest_value = size_index.smallest_to_free(total_disk_space,
+                                                space_required_for_update)
     print("Part 2 - The smallest directory that could be deleted to "
           f"free enough memory has a size of {closest_value}.")
 
@@ -81,8 +81,12 @@ def calculate_scenic_scores(grid: Iterable[Iterable]):
     return scenic_scores
 
 
+def parse_input(filename: str) -> list[str]:
+    return list(map(str.strip, open(filename).readlines()))
+
+
 def part_1():
-    grid = list(map(str.strip, open("day_08/input.txt").readlines()))
+    grid = parse_input("day_08/input.txt")
     visible_trees_record = {}
 
     # Left and right
@@ -110,7 +114,7 @@ def part_1():
 
 
 def part_2():
-    grid = list(map(str.strip, open("day_08/input.txt").readlines()))
+    grid = parse_input("day_08/input.txt")
     scenic_scores = calculate_scenic_scores(grid)
 
     print("Part 2 - The highest scenic score for any tree is "
@@ -1,7 +1,6 @@
 """Day 16: Proboscidea Volcanium
 """
 import random
-import matplotlib.pyplot as plt
 # random.seed("Day 16")
 
 
@@ -127,6 +126,7 @@ def part_1():
 
     print(max(best_in_iterations))
 
+    import matplotlib.pyplot as plt
     plt.plot([i for i in range(len(best_in_iterations))],
              best_in_iterations)
     plt.xlabel('Iteration')
@@ -1,9 +1,6 @@
 """Day 18: Boiling Boulders
 """
 
-import matplotlib.pyplot as plt
-import numpy as np
-
 SIDES_MAP = [
     (1,  0,  0),
     (0,  1,  0),
@@ -133,6 +130,10 @@ def air_cube_sides_touching_cubes(air_cubes, cubes):
 
 
 def plot_cubes(air_cubes, lava_cubes):
+    # Imported here since they take longer to load than solving part 1
+    import matplotlib.pyplot as plt
+    import numpy as np
+
     cube_maxes, _ = find_cube_maxmin(lava_cubes)
     cube_points = np.array([list(map(int, cube.split(",")))
                             for cube in lava_cubes])
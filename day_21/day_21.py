@@ -2,7 +2,6 @@
 """
 
 from operator import mul, truediv, sub, add
-from sympy import symbols, solve
 
 
 def parse_input(filename: str):
@@ -69,7 +68,8 @@ def part_2():
     expression = side_of_unknown + " - " + other_side
 
     # This might be considered cheating but time
-    # is money friend.
+    # is money friend. Sympy is slow to import so it is only loaded here.
+    from sympy import symbols, solve
     humn = symbols("humn")  # NOQA
     expr = eval(expression)
     solution = solve(expr)
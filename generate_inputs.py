@@ -0,0 +1,517 @@
+"""Seeded synthetic puzzle inputs
+
+Generates valid inputs of any size for every day with a puzzle input. The
+same day, size and seed always produce the same file:
+
+    python generate_inputs.py 1 --size 1000000 --seed 7 -o day_01/large.txt
+
+What _size_ counts differs per day, see the docstring of each generator.
+"""
+import argparse
+import random
+import string
+from typing import Iterator
+
+LETTERS = string.ascii_lowercase + string.ascii_uppercase
+
+
+def generate_day_01(rng: random.Random, size: int) -> Iterator[str]:
+    """_size_ calorie lines, grouped into inventories of 1-15 items.
+    """
+    lines_left = size
+    while lines_left > 0:
+        inventory_size = min(lines_left, rng.randint(1, 15))
+        lines_left -= inventory_size
+        yield "".join(f"{rng.randint(1000, 60000)}\n"
+                      for _ in range(inventory_size))
+        if lines_left:
+            yield "\n"
+
+
+def generate_day_02(rng: random.Random, size: int) -> Iterator[str]:
+    """_size_ rounds of Rock, Paper, Scissors.
+    """
+    line_types = [f"{opponent} {player}\n"
+                  for opponent in "ABC" for player in "XYZ"]
+    block_size = 10_000
+    for start in range(0, size, block_size):
+        yield "".join(rng.choices(line_types, k=min(block_size,
+                                                    size-start)))
+
+
+def generate_rucksack(rng: random.Random, pool: list[str], badge: str):
+    """Creates a rucksack from the items in _pool_ that contains _badge_ and
+    has exactly one item type in both compartments.
+    """
+    items = pool + [badge]
+    duplicate = rng.choice(items)
+    rest = [item for item in items if item != duplicate]
+    rng.shuffle(rest)
+    left, right = rest[:len(rest)//2], rest[len(rest)//2:]
+    compartment_len = rng.randint(8, 24)
+    first = [duplicate] + rng.choices(left, k=compartment_len-1)
+    second = [duplicate] + rng.choices(right, k=compartment_len-1)
+    if badge != duplicate:
+        compartment = first if badge in left else second
+        compartment[rng.randint(1, compartment_len-1)] = badge
+    rng.shuffle(first)
+    rng.shuffle(second)
+    return "".join(first + second)
+
+
+def generate_day_03(rng: random.Random, size: int) -> Iterator[str]:
+    """_size_ rucksacks, rounded up to whole groups of three elves. The
+    rucksacks of a group draw from disjoint item pools apart from the badge,
+    which makes the badge their only common item.
+    """
+    for _ in range(0, size, 3):
+        badge = rng.choice(LETTERS)
+        others = [letter for letter in LETTERS if letter != badge]
+        rng.shuffle(others)
+        for i in range(3):
+            pool = others[i*17:(i+1)*17]
+            yield generate_rucksack(rng, pool, badge) + "\n"
+
+
+def generate_day_04(rng: random.Random, size: int) -> Iterator[str]:
+    """_size_ pairs of section assignments.
+    """
+    def interval():
+        start = rng.randint(1, 99)
+        return f"{start}-{rng.randint(start, 99)}"
+
+    block_size = 10_000
+    for start in range(0, size, block_size):
+        yield "".join(f"{interval()},{interval()}\n"
+                      for _ in range(min(block_size, size-start)))
+
+
+def generate_day_05(rng: random.Random, size: int, num_stacks: int = 9,
+                    crates_per_stack: int = 8,
+                    max_move: int = 10) -> Iterator[str]:
+    """_size_ rearrangement instructions on _num_stacks_ (at most 9) stacks.
+    """
+    if not 1 <= num_stacks <= 9:
+        raise ValueError("The drawing only fits 1-9 stacks.")
+    heights = [crates_per_stack] * num_stacks
+    for row in range(crates_per_stack):
+        yield " ".join(f"[{rng.choice(string.ascii_uppercase)}]"
+                       for _ in range(num_stacks)) + "\n"
+    yield " " + "   ".join(str(i+1) for i in range(num_stacks)) + " \n"
+    yield "\n"
+
+    for _ in range(size):
+        source = rng.choice([i for i in range(num_stacks) if heights[i]])
+        target = rng.choice([i for i in range(num_stacks) if i != source]
+                            or [source])
+        move = rng.randint(1, min(max_move, heights[source]))
+        heights[source] -= move
+        heights[target] += move
+        yield f"move {move} from {source+1} to {target+1}\n"
+
+
+def generate_day_06(rng: random.Random, size: int) -> Iterator[str]:
+    """A datastream of _size_ characters (at least 14) where both markers
+    are only found at the very end. The body only uses three different
+    characters so no window of four unique characters exists before the
+    tail.
+    """
+    if size < 14:
+        raise ValueError("The datastream needs room for a 14 long marker.")
+    body_len = size - 14
+    block_size = 1_000_000
+    for start in range(0, body_len, block_size):
+        yield "".join(rng.choices("abc", k=min(block_size,
+                                               body_len-start)))
+    yield "".join(rng.sample(string.ascii_lowercase[3:], 14)) + "\n"
+
+
+def generate_day_07(rng: random.Random, size: int,
+                    depth_bias: float = 0.5) -> Iterator[str]:
+    """A terminal transcript exploring _size_ directories. With probability
+    _depth_bias_ a directory is placed inside the previous one, which makes
+    the tree deeper the closer the bias is to 1.
+    """
+    children = [[] for _ in range(size)]
+    for directory in range(1, size):
+        if rng.random() < depth_bias:
+            parent = directory - 1
+        else:
+            parent = rng.randrange(directory)
+        children[parent].append(directory)
+
+    yield "$ cd /\n"
+    stack = [(0, False)]
+    while stack:
+        directory, listed = stack.pop()
+        if listed:
+            yield "$ cd ..\n"
+            continue
+        if directory != 0:
+            yield f"$ cd d{directory}\n"
+        listing = [f"dir d{child}\n" for child in children[directory]]
+        listing.extend(f"{rng.randint(1, 300_000)} f{i}.txt\n"
+                       for i in range(rng.randint(0, 4)))
+        rng.shuffle(listing)
+        yield "$ ls\n" + "".join(listing)
+        if directory != 0:
+            stack.append((directory, True))
+        stack.extend((child, False) for child in reversed(children[directory]))
+
+
+def generate_day_08(rng: random.Random, size: int) -> Iterator[str]:
+    """A _size_ x _size_ grid of tree heights.
+    """
+    for _ in range(size):
+        yield "".join(rng.choices(string.digits, k=size)) + "\n"
+
+
+def generate_day_09(rng: random.Random, size: int) -> Iterator[str]:
+    """_size_ motions of the rope head.
+    """
+    block_size = 10_000
+    for start in range(0, size, block_size):
+        yield "".join(f"{rng.choice('RLUD')} {rng.randint(1, 20)}\n"
+                      for _ in range(min(block_size, size-start)))
+
+
+def generate_day_10(rng: random.Random, size: int) -> Iterator[str]:
+    """_size_ CPU instructions. The register stays within the 40 pixel
+    wide screen, but only the first 240 cycles fit on the screen of part 2.
+    """
+    x = 1
+    for _ in range(size):
+        if rng.random() < 0.4:
+            yield "noop\n"
+        else:
+            value = rng.randint(max(-5, -1-x), min(5, 40-x))
+            x += value
+            yield f"addx {value}\n"
+
+
+def generate_day_11(rng: random.Random, size: int) -> Iterator[str]:
+    """_size_ (at least 2) monkeys. Their tests use distinct primes so the
+    worry levels of part 2 can be kept modulo the product of the tests.
+    """
+    if size < 2:
+        raise ValueError("A monkey needs another monkey to throw to.")
+    primes = []
+    candidate = 2
+    while len(primes) < size:
+        if all(candidate % prime for prime in primes):
+            primes.append(candidate)
+        candidate += 1
+    rng.shuffle(primes)
+
+    for monkey, prime in enumerate(primes):
+        items = ", ".join(str(rng.randint(50, 99))
+                          for _ in range(rng.randint(1, 8)))
+        if monkey == 0:
+            operation = "old * old"
+        elif rng.random() < 0.5:
+            operation = f"old * {rng.randint(2, 19)}"
+        else:
+            operation = f"old + {rng.randint(1, 8)}"
+        targets = rng.sample([other for other in range(size)
+                              if other != monkey] * 2, 2)
+        if monkey:
+            yield "\n\n"
+        yield (f"Monkey {monkey}:\n"
+               f"  Starting items: {items}\n"
+               f"  Operation: new = {operation}\n"
+               f"  Test: divisible by {prime}\n"
+               f"    If true: throw to monkey {targets[0]}\n"
+               f"    If false: throw to monkey {targets[1]}")
+
+
+def generate_day_12(rng: random.Random, size: int) -> Iterator[str]:
+    """A _size_ x _size_ (at least 14 x 14) heightmap that rises towards a
+    randomly placed E by one level per step, so E is reachable from S in
+    the corner farthest from it. S and E are at least 25 steps apart, the
+    climb from a to z, which smaller heightmaps have no room for.
+    """
+    if size < 14:
+        raise ValueError("The heightmap must be at least 14 x 14.")
+    corners = [(0, 0), (0, size-1), (size-1, 0), (size-1, size-1)]
+
+    def distance(point):
+        return abs(point[0]-end[0]) + abs(point[1]-end[1])
+
+    while True:
+        end = rng.randrange(size), rng.randrange(size)
+        start = max(corners, key=distance)
+        if distance(start) >= 25:
+            break
+
+    for i in range(size):
+        row = []
+        for j in range(size):
+            if (i, j) == start:
+                row.append("S")
+            elif (i, j) == end:
+                row.append("E")
+            else:
+                height = max(0, 25 - distance((i, j)))
+                row.append(string.ascii_lowercase[height])
+        yield "".join(row) + "\n"
+
+
+def generate_packet(rng: random.Random, depth: int = 0) -> str:
+    items = []
+    for _ in range(rng.randint(0, 5)):
+        if depth < 4 and rng.random() < 0.3:
+            items.append(generate_packet(rng, depth+1))
+        else:
+            items.append(str(rng.randint(0, 10)))
+    return "[" + ",".join(items) + "]"
+
+
+def generate_day_13(rng: random.Random, size: int) -> Iterator[str]:
+    """_size_ pairs of packets. The file has no trailing newline since the
+    parser expects exactly two lines per pair.
+    """
+    for pair in range(size):
+        if pair:
+            yield "\n\n"
+        yield f"{generate_packet(rng)}\n{generate_packet(rng)}"
+
+
+def generate_day_14(rng: random.Random, size: int) -> Iterator[str]:
+    """_size_ rock paths spread around the sand source at x=500 about as
+    sparsely as in the puzzle input, so sand still flows into the abyss
+    before piling up to the source. The first path is a lone rock far to
+    the right, which makes the map cover the source and the sand that
+    spills past the other paths.
+    """
+    spread = max(20, round(5 * size**0.5))
+    depth = 15 + 2*spread
+    yield f"{500+spread+10},{depth} -> {500+spread+10},{depth}\n"
+    for _ in range(size-1):
+        x = rng.randint(500-spread, 500+spread)
+        y = rng.randint(15, depth)
+        points = [(x, y)]
+        for segment in range(rng.randint(1, 5)):
+            length = rng.randint(1, 8) * rng.choice((-1, 1))
+            if segment % 2 == 0:
+                x = min(max(x + length, 500-spread), 500+spread)
+            else:
+                y = min(max(y + length, 15), depth)
+            points.append((x, y))
+        yield " -> ".join(f"{x},{y}" for x, y in points) + "\n"
+
+
+def generate_day_15(rng: random.Random, size: int,
+                    area: int = 4_000_000) -> Iterator[str]:
+    """_size_ sensors and their closest beacons within a square of side
+    _area_.
+    """
+    for _ in range(size):
+        sensor_x, sensor_y = rng.randrange(area), rng.randrange(area)
+        distance = rng.randint(1, area // 10)
+        dx = rng.randint(-distance, distance)
+        dy = (distance - abs(dx)) * rng.choice((-1, 1))
+        yield (f"Sensor at x={sensor_x}, y={sensor_y}: closest beacon is at "
+               f"x={sensor_x+dx}, y={sensor_y+dy}\n")
+
+
+def generate_day_20(rng: random.Random, size: int) -> Iterator[str]:
+    """_size_ numbers to mix, exactly one of which is 0.
+    """
+    zero_index = rng.randrange(size)
+    for i in range(size):
+        if i == zero_index:
+            yield "0\n"
+        else:
+            yield f"{rng.choice((-1, 1)) * rng.randint(1, 10_000)}\n"
+
+
+def generate_day_16(rng: random.Random, size: int,
+                    flow_valves: int = 15) -> Iterator[str]:
+    """_size_ valves (2-676) in a connected tunnel network starting at AA,
+    _flow_valves_ of which have a flow rate. The search over the valves
+    with a flow rate is exponential, so keep _flow_valves_ small.
+    """
+    names = [a + b for a in string.ascii_uppercase
+             for b in string.ascii_uppercase]
+    if not 2 <= size <= len(names):
+        raise ValueError(f"There are only {len(names)} valve names.")
+    names.remove("AA")
+    names = ["AA"] + rng.sample(names, size-1)
+    flow_rates = dict.fromkeys(names, 0)
+    for name in rng.sample(names[1:], min(flow_valves, size-1)):
+        flow_rates[name] = rng.randint(1, 25)
+
+    tunnels = {name: set() for name in names}
+    for i in range(1, size):
+        other = names[rng.randrange(i)]
+        tunnels[names[i]].add(other)
+        tunnels[other].add(names[i])
+    for _ in range(size // 20):
+        a, b = rng.sample(names, 2)
+        tunnels[a].add(b)
+        tunnels[b].add(a)
+
+    for name in names:
+        connections = sorted(tunnels[name])
+        rng.shuffle(connections)
+        plural = "s lead to valves" if len(connections) > 1 \
+            else " leads to valve"
+        yield (f"Valve {name} has flow rate={flow_rates[name]}; "
+               f"tunnel{plural} {', '.join(connections)}\n")
+
+
+def generate_day_17(rng: random.Random, size: int) -> Iterator[str]:
+    """A jet pattern of _size_ pushes.
+    """
+    block_size = 1_000_000
+    for start in range(0, size, block_size):
+        yield "".join(rng.choices("<>", k=min(block_size, size-start)))
+    yield "\n"
+
+
+def generate_day_18(rng: random.Random, size: int) -> Iterator[str]:
+    """_size_ distinct lava cubes filling about half of a cube shaped
+    volume, which leaves plenty of air pockets inside.
+    """
+    side = max(1, round((2 * size) ** (1/3)))
+    while side ** 3 < size:
+        side += 1
+    for position in rng.sample(range(side ** 3), size):
+        yield (f"{position // side**2},{position // side % side},"
+               f"{position % side}\n")
+
+
+def generate_day_19(rng: random.Random, size: int) -> Iterator[str]:
+    """_size_ blueprints with costs in the ranges of the puzzle input.
+    """
+    for blueprint in range(1, size+1):
+        yield (f"Blueprint {blueprint}: "
+               f"Each ore robot costs {rng.randint(2, 4)} ore. "
+               f"Each clay robot costs {rng.randint(2, 4)} ore. "
+               f"Each obsidian robot costs {rng.randint(2, 4)} ore and "
+               f"{rng.randint(5, 20)} clay. "
+               f"Each geode robot costs {rng.randint(2, 4)} ore and "
+               f"{rng.randint(7, 20)} obsidian.\n")
+
+
+def generate_day_21(rng: random.Random, size: int) -> Iterator[str]:
+    """About _size_ (at least 3) monkeys yelling numbers or the results of
+    other monkeys. Every division is exact, and humn only appears once and
+    never as a divisor, so the equation of part 2 stays linear.
+    """
+    if size < 3:
+        raise ValueError("root needs two monkeys to listen to.")
+    num_leaves = (size + 1) // 2
+    used_names = {"root", "humn"}
+    while len(used_names) < 2 * num_leaves + 1:
+        used_names.add("".join(rng.choices(string.ascii_lowercase, k=4)))
+    names = sorted(used_names - {"root", "humn"})
+    rng.shuffle(names)
+
+    # Nodes are (name, value, contains humn), combined two at a time in a
+    # random order until only the root is left.
+    lines = []
+    nodes = []
+    for i in range(num_leaves):
+        name = "humn" if i == 0 else names.pop()
+        value = rng.randint(1, 20)
+        lines.append(f"{name}: {value}\n")
+        nodes.append((name, value, name == "humn"))
+    while len(nodes) > 1:
+        pair = []
+        for _ in range(2):
+            i = rng.randrange(len(nodes))
+            nodes[i], nodes[-1] = nodes[-1], nodes[i]
+            pair.append(nodes.pop())
+        (a, a_value, a_humn), (b, b_value, b_humn) = pair
+        if (b_value != 0 and not b_humn and a_value % b_value == 0
+                and rng.random() < 0.5):
+            operator, value = "/", a_value // b_value
+        elif (0 < abs(a_value * b_value) < 10**12
+              and rng.random() < 0.3):
+            operator, value = "*", a_value * b_value
+        elif rng.random() < 0.5:
+            operator, value = "-", a_value - b_value
+        else:
+            operator, value = "+", a_value + b_value
+        name = "root" if len(nodes) == 0 else names.pop()
+        lines.append(f"{name}: {a} {operator} {b}\n")
+        nodes.append((name, value, a_humn or b_humn))
+
+    rng.shuffle(lines)
+    yield from lines
+
+
+def generate_day_22(rng: random.Random, size: int,
+                    num_moves: int = 2000) -> Iterator[str]:
+    """A board folding into a cube with _size_ x _size_ faces, in the same
+    layout as the puzzle input, followed by a path of _num_moves_ moves.
+    """
+    faces = {(0, 1), (0, 2), (1, 1), (2, 0), (2, 1), (3, 0)}
+    for row in range(4 * size):
+        columns = [column for column in range(3)
+                   if (row // size, column) in faces]
+        tiles = rng.choices(".#", weights=(9, 1),
+                            k=len(columns) * size)
+        if row == 0:
+            tiles[0] = "."
+        yield " " * (columns[0] * size) + "".join(tiles) + "\n"
+
+    yield "\n"
+    yield "".join(f"{rng.randint(1, 50)}{rng.choice('LR')}"
+                  for _ in range(num_moves - 1))
+    yield f"{rng.randint(1, 50)}\n"
+
+
+GENERATORS = {
+    1: generate_day_01,
+    2: generate_day_02,
+    3: generate_day_03,
+    4: generate_day_04,
+    5: generate_day_05,
+    6: generate_day_06,
+    7: generate_day_07,
+    8: generate_day_08,
+    9: generate_day_09,
+    10: generate_day_10,
+    11: generate_day_11,
+    12: generate_day_12,
+    13: generate_day_13,
+    14: generate_day_14,
+    15: generate_day_15,
+    16: generate_day_16,
+    17: generate_day_17,
+    18: generate_day_18,
+    19: generate_day_19,
+    20: generate_day_20,
+    21: generate_day_21,
+    22: generate_day_22,
+}
+
+
+def generate_input(day: int, size: int, seed: int = 0,
+                   **kwargs) -> Iterator[str]:
+    if day not in GENERATORS:
+        raise ValueError(f"There is no input generator for day {day}.")
+    return GENERATORS[day](random.Random(seed), size, **kwargs)
+
+
+def write_input(day: int, filename: str, size: int, seed: int = 0,
+                **kwargs):
+    with open(filename, "w", newline="\n") as f:
+        f.writelines(generate_input(day, size, seed, **kwargs))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    parser.add_argument("--size", type=int, required=True)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", required=True)
+    arguments = parser.parse_args(argv)
+    write_input(arguments.day, arguments.output, arguments.size,
+                arguments.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Import time budget for the daily solutions
+
+Imports every day_NN/day_NN.py module in a fresh interpreter with
+-X importtime and reports how long each one takes to import, including
+everything it imports. Exits with status 1 if any module is over budget or
+fails to import, so heavy dependencies that sneak back to module level are
+caught:
+
+    python import_budget.py --budget-ms 50
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+from benchmark import REPOSITORY_ROOT, find_days
+
+
+def measure_import_time(day: int):
+    """Returns the cumulative import time of a day module in milliseconds,
+    or None together with the error if the module could not be imported.
+    """
+    module_name = f"day_{day:02d}.day_{day:02d}"
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        cwd=REPOSITORY_ROOT, capture_output=True, text=True
+    )
+    if process.returncode != 0:
+        return None, process.stderr.strip().splitlines()[-1]
+
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split(":", 1)[1].split("|")
+        if name.strip() == module_name:
+            return int(cumulative) / 1000, None
+
+    return None, "No import time reported for the module."
+
+
+def check_import_budget(days: list[int], budget_ms: float):
+    report = []
+    for day in days:
+        import_time, error = measure_import_time(day)
+        report.append({
+            "day": day,
+            "import_time_ms": import_time,
+            "error": error,
+            "over_budget": import_time is not None and import_time > budget_ms,
+        })
+
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("days", nargs="*", type=int,
+                        help="Days to check, all days if omitted.")
+    parser.add_argument("--budget-ms", type=float, default=50.0)
+    parser.add_argument("--json", action="store_true",
+                        help="Print the report as JSON.")
+    arguments = parser.parse_args(argv)
+
+    report = check_import_budget(arguments.days or find_days(),
+                                 arguments.budget_ms)
+    if arguments.json:
+        print(json.dumps(report, indent=4))
+    else:
+        for entry in report:
+            if entry["error"] is not None:
+                status = f"import failed: {entry['error']}"
+            else:
+                status = (f"{entry['import_time_ms']:8.2f} ms"
+                          + ("  OVER BUDGET" if entry["over_budget"] else ""))
+            print(f"day {entry['day']:02d}: {status}")
+
+    if any(entry["over_budget"] or entry["error"] is not None
+           for entry in report):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
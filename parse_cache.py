@@ -0,0 +1,239 @@
+"""Content-addressed cache for parsed puzzle inputs
+
+A parser result is stored under a key made from the parser's identity
+(module, name, compiled code and the source of its whole module, so a
+changed helper class or function is a miss as well) and the hash of its
+input: the file contents for filename arguments and the pickled value for
+anything else, such as a list of lines. Results are kept as pickles both
+in memory and on disk, and each hit is unpickled into a fresh object since
+the solutions mutate what their parsers return. Entries that can no longer
+be unpickled are treated as misses.
+
+The day modules are left untouched, the cache is installed by replacing
+their parser functions:
+
+    cache = ParseCache()
+    install_parse_cache(day_05, cache)
+"""
+import hashlib
+import os
+import pickle
+import sys
+from collections import OrderedDict
+from functools import wraps
+from pathlib import Path
+
+DEFAULT_DIRECTORY = Path(__file__).resolve().parent / ".parse_cache"
+
+# Parser functions for each day that are safe to cache, i.e. the ones whose
+# result only depends on their arguments.
+PARSERS = {
+    1: ["get_inventories_from_file"],
+    5: ["get_starting_state_from_file", "get_instructions_from_file"],
+    7: ["parse_input"],
+    8: ["parse_input"],
+    11: ["create_monkeys_from_input_file"],
+    12: ["parse_file"],
+    13: ["parse_file"],
+    14: ["get_rock_paths_from_lines"],
+    16: ["parse_input"],
+    17: ["parse_blocks_file"],
+    18: ["parse_input"],
+    19: ["parse_input"],
+    20: ["parse_input"],
+    21: ["parse_input"],
+    22: ["parse_input"],
+}
+
+
+def parser_identity(parser) -> bytes:
+    code = parser.__code__
+    return b"\0".join([
+        parser.__module__.encode(),
+        parser.__qualname__.encode(),
+        code.co_code,
+        repr(code.co_consts).encode(),
+    ])
+
+
+class ParseCache:
+    def __init__(self, directory: Path = DEFAULT_DIRECTORY,
+                 max_memory_bytes: int = 64 * 2**20,
+                 max_disk_bytes: int = 512 * 2**20) -> None:
+        self.directory = None if directory is None else Path(directory)
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.memory = OrderedDict()
+        self.memory_bytes = 0
+        self.file_digests = {}
+        self.hits = 0
+        self.misses = 0
+
+    def file_digest(self, filename: str) -> bytes:
+        """Hashes the file contents, remembering the digest for as long as
+        the file's size and modification time stay the same.
+        """
+        stat = os.stat(filename)
+        signature = (stat.st_size, stat.st_mtime_ns)
+        path = os.path.abspath(filename)
+        cached = self.file_digests.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        digest = hashlib.sha256()
+        with open(filename, "rb") as f:
+            for block in iter(lambda: f.read(2**20), b""):
+                digest.update(block)
+        self.file_digests[path] = (signature, digest.digest())
+        return digest.digest()
+
+    def argument_digest(self, argument) -> bytes:
+        if isinstance(argument, (str, os.PathLike)) \
+           and os.path.isfile(argument):
+            return b"file:" + self.file_digest(argument)
+        return b"value:" + hashlib.sha256(pickle.dumps(argument)).digest()
+
+    def source_digest(self, parser) -> bytes:
+        """Hashes the source file of the module defining _parser_, which
+        covers the helpers and classes the parser depends on.
+        """
+        filename = getattr(sys.modules.get(parser.__module__), "__file__",
+                           None)
+        if filename is None or not os.path.isfile(filename):
+            return b"source:"
+        return b"source:" + self.file_digest(filename)
+
+    def make_key(self, parser, args, kwargs) -> str:
+        digest = hashlib.sha256(parser_identity(parser))
+        digest.update(self.source_digest(parser))
+        for argument in args:
+            digest.update(self.argument_digest(argument))
+        for name in sorted(kwargs):
+            digest.update(name.encode())
+            digest.update(self.argument_digest(kwargs[name]))
+        return digest.hexdigest()
+
+    def get(self, key: str):
+        payload = self.memory.get(key)
+        if payload is not None:
+            self.memory.move_to_end(key)
+            return payload
+
+        if self.directory is None:
+            return None
+        path = self.directory / f"{key}.pickle"
+        try:
+            payload = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        os.utime(path)
+        self.remember(key, payload)
+        return payload
+
+    def put(self, key: str, payload: bytes):
+        self.remember(key, payload)
+        if self.directory is None or len(payload) > self.max_disk_bytes:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{key}.pickle"
+        temporary_path = path.with_suffix(f".{os.getpid()}.tmp")
+        temporary_path.write_bytes(payload)
+        os.replace(temporary_path, path)
+        self.evict_from_disk()
+
+    def remember(self, key: str, payload: bytes):
+        if len(payload) > self.max_memory_bytes:
+            return
+        if key in self.memory:
+            self.memory_bytes -= len(self.memory.pop(key))
+        self.memory[key] = payload
+        self.memory_bytes += len(payload)
+        while self.memory_bytes > self.max_memory_bytes:
+            _, evicted = self.memory.popitem(last=False)
+            self.memory_bytes -= len(evicted)
+
+    def evict_from_disk(self):
+        """Removes the least recently used entries until the cache directory
+        fits within _max_disk_bytes_.
+        """
+        entries = []
+        total_bytes = 0
+        for path in self.directory.glob("*.pickle"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+            total_bytes += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total_bytes <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_bytes -= size
+
+    def discard(self, key: str):
+        if key in self.memory:
+            self.memory_bytes -= len(self.memory.pop(key))
+        if self.directory is not None:
+            (self.directory / f"{key}.pickle").unlink(missing_ok=True)
+
+    def clear(self):
+        self.memory.clear()
+        self.memory_bytes = 0
+        if self.directory is not None:
+            for path in self.directory.glob("*.pickle"):
+                path.unlink(missing_ok=True)
+
+    def cached(self, parser):
+        @wraps(parser)
+        def cached_parser(*args, **kwargs):
+            key = self.make_key(parser, args, kwargs)
+            payload = self.get(key)
+            if payload is not None:
+                try:
+                    result = pickle.loads(payload)
+                except Exception:
+                    # Stored by an older version of the classes in it, or
+                    # corrupted, so it is parsed again and replaced.
+                    self.discard(key)
+                else:
+                    self.hits += 1
+                    return result
+
+            self.misses += 1
+            result = parser(*args, **kwargs)
+            try:
+                payload = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, TypeError, AttributeError,
+                    RecursionError):
+                # Not every parsed structure can be stored, those are
+                # simply parsed every time.
+                return result
+            self.put(key, payload)
+            return result
+
+        cached_parser.__wrapped_parser__ = parser
+        return cached_parser
+
+
+def install_parse_cache(module, cache: ParseCache, parser_names=None):
+    """Replaces the parser functions of a day module with cached versions.
+    The parsers listed in _PARSERS_ are used unless _parser_names_ is given.
+
+    Returns:
+        list[str]: The names of the parsers that were replaced.
+    """
+    if parser_names is None:
+        day = int(Path(module.__file__).stem.split("_")[1])
+        parser_names = PARSERS.get(day, [])
+
+    installed = []
+    for name in parser_names:
+        parser = getattr(module, name)
+        parser = getattr(parser, "__wrapped_parser__", parser)
+        setattr(module, name, cache.cached(parser))
+        installed.append(name)
+
+    return installed